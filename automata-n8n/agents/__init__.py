@@ -8,11 +8,12 @@ Version: 1.0.0
 Created: 2025-11-08
 """
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
@@ -59,6 +60,7 @@ class BaseAgent(ABC):
         self.task_count = 0
         self.success_count = 0
         self.error_count = 0
+        self._perf_cache: Optional[Tuple[Tuple[str, int, int, int], Dict[str, Any]]] = None
 
     @abstractmethod
     def execute(self, task: AgentTask) -> AgentResult:
@@ -75,6 +77,24 @@ class BaseAgent(ABC):
         """
         pass
 
+    async def aexecute(self, task: AgentTask) -> AgentResult:
+        """
+        Execute assigned task without blocking the event loop.
+
+        Args:
+            task: Standardized AgentTask
+
+        Returns:
+            AgentResult with output and reasoning
+
+        Reasoning: Running execute() in a worker thread lets independent
+        agents be awaited together with asyncio.gather. The task counters
+        updated by execute() are not synchronized, so one agent instance
+        must not serve concurrent aexecute() calls; use one instance per
+        concurrent task.
+        """
+        return await asyncio.to_thread(self.execute, task)
+
     def log_reasoning(self, message: str) -> None:
         """Log reasoning trace for transparency"""
         self.logger.info(f"[REASONING] {message}")
@@ -110,14 +130,37 @@ class BaseAgent(ABC):
         else:
             self.error_count += 1
 
+    def update_stats_batch(self, n_success: int, n_error: int) -> None:
+        """Update agent performance statistics for several finished tasks at once"""
+        if n_success < 0 or n_error < 0:
+            raise ValueError("n_success and n_error must be non-negative")
+        self.task_count += n_success + n_error
+        self.success_count += n_success
+        self.error_count += n_error
+
     def get_performance(self) -> Dict[str, Any]:
-        """Get agent performance metrics"""
+        """
+        Get agent performance metrics.
+
+        The metrics are computed once per counter state and cached; each call
+        returns a fresh copy, so callers may modify or serialize it freely.
+
+        Reasoning: Keying the cache on the counters themselves (rather than a
+        dirty flag set in update_stats) stays correct when they are assigned
+        directly
+        """
+        key = (self.name, self.task_count, self.success_count, self.error_count)
+        if self._perf_cache is not None and self._perf_cache[0] == key:
+            return dict(self._perf_cache[1])
+
         success_rate = (self.success_count / self.task_count * 100) if self.task_count > 0 else 0
 
-        return {
+        performance = {
             "agent": self.name,
             "tasks_completed": self.task_count,
             "successes": self.success_count,
             "errors": self.error_count,
             "success_rate": f"{success_rate:.1f}%",
         }
+        self._perf_cache = (key, performance)
+        return dict(performance)
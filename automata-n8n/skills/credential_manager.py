@@ -35,6 +35,13 @@ except ImportError:
         "cryptography library not available. Install with: pip install cryptography"
     )
 
+# Optional fast JSON serializer for manifest export
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Configure logging - Application should configure logging, not libraries
 # logging.basicConfig() removed to prevent global logging configuration conflicts
 logger = logging.getLogger(__name__)
@@ -540,8 +547,12 @@ class CredentialManager:
 
         manifest = self.export_credentials_manifest()
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(manifest, f, indent=2)
+        if ORJSON_AVAILABLE:
+            with open(filepath, "wb") as f:
+                f.write(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filepath, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, indent=2)
 
         # Set restrictive file permissions (owner read/write only)
         try:
@@ -739,6 +750,24 @@ class CredentialLibrary:
         )
 
 
+# Service name -> CredentialLibrary factory, built once at import
+_COMMON_CREDENTIAL_FACTORIES = {
+    "http_basic": CredentialLibrary.http_basic_auth,
+    "http_header": CredentialLibrary.http_header_auth,
+    "oauth2": CredentialLibrary.oauth2,
+    "postgres": CredentialLibrary.postgres,
+    "postgresql": CredentialLibrary.postgres,
+    "mysql": CredentialLibrary.mysql,
+    "mongodb": CredentialLibrary.mongodb,
+    "mongo": CredentialLibrary.mongodb,
+    "slack": CredentialLibrary.slack,
+    "email": CredentialLibrary.email_smtp,
+    "smtp": CredentialLibrary.email_smtp,
+    "aws": CredentialLibrary.aws,
+    "github": CredentialLibrary.github,
+}
+
+
 # Convenience functions
 def create_credential(name: str, credential_type: str, **kwargs) -> CredentialTemplate:
     """
@@ -769,27 +798,14 @@ def get_common_credential(service: str, **kwargs) -> CredentialTemplate:
     Raises:
         ValueError: If service not found
     """
-    service_map = {
-        "http_basic": CredentialLibrary.http_basic_auth,
-        "http_header": CredentialLibrary.http_header_auth,
-        "oauth2": CredentialLibrary.oauth2,
-        "postgres": CredentialLibrary.postgres,
-        "postgresql": CredentialLibrary.postgres,
-        "mysql": CredentialLibrary.mysql,
-        "mongodb": CredentialLibrary.mongodb,
-        "mongo": CredentialLibrary.mongodb,
-        "slack": CredentialLibrary.slack,
-        "email": CredentialLibrary.email_smtp,
-        "smtp": CredentialLibrary.email_smtp,
-        "aws": CredentialLibrary.aws,
-        "github": CredentialLibrary.github,
-    }
-
-    service_lower = service.lower()
-    if service_lower not in service_map:
-        raise ValueError(f"Unknown service: {service}. Available: {', '.join(service_map.keys())}")
-
-    return service_map[service_lower](**kwargs)
+    factory = _COMMON_CREDENTIAL_FACTORIES.get(service.lower())
+    if factory is None:
+        raise ValueError(
+            f"Unknown service: {service}. "
+            f"Available: {', '.join(_COMMON_CREDENTIAL_FACTORIES.keys())}"
+        )
+
+    return factory(**kwargs)
 
 
 if __name__ == "__main__":
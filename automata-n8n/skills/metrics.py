@@ -23,7 +23,7 @@ from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 
 # Configure logging with structured format
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
@@ -102,13 +102,14 @@ class MetricsCollector:
         return self.metrics.get(full_name, Metric(full_name, MetricType.GAUGE)).value
 
     # Timer Methods
-    def start_timer(self, name: str) -> float:
-        """Start timing an operation"""
-        return time.perf_counter()
+    def start_timer(self, name: str) -> int:
+        """Start timing an operation (returns an opaque monotonic timestamp in ns)"""
+        return time.perf_counter_ns()
 
-    def stop_timer(self, name: str, start_time: float, labels: Optional[Dict] = None) -> float:
-        """Stop timer and record duration"""
-        duration_ms = (time.perf_counter() - start_time) * 1000
+    def stop_timer(self, name: str, start_time: int, labels: Optional[Dict] = None) -> float:
+        """Stop timer and record duration in milliseconds"""
+        # Integer ns subtraction keeps full resolution regardless of process uptime
+        duration_ms = (time.perf_counter_ns() - start_time) / 1_000_000
 
         full_name = f"{self.app_name}_{name}"
         with self._lock:
@@ -151,6 +152,20 @@ class MetricsCollector:
                 self.timers[full_name] = deque(maxlen=1000)
             self.timers[full_name].append(value)
 
+    def record_histogram_batch(
+        self, name: str, values: Iterable[float], labels: Optional[Dict] = None
+    ):
+        """Record many values in a histogram under a single lock acquisition"""
+        full_name = f"{self.app_name}_{name}"
+        # Consume the iterable before taking the lock; only the newest 1000
+        # values can survive the bounded deque anyway
+        batch = deque(values, maxlen=1000)
+        with self._lock:
+            if full_name not in self.timers:
+                # Use deque with maxlen=1000 for bounded storage (prevents memory leak)
+                self.timers[full_name] = deque(maxlen=1000)
+            self.timers[full_name].extend(batch)
+
     # Prometheus Format Export
     def export_prometheus(self) -> str:
         """Export metrics in Prometheus format"""
@@ -218,12 +233,12 @@ def set_gauge(name: str, value: float, labels: Optional[Dict] = None):
     _metrics.set_gauge(name, value, labels)
 
 
-def start_timer(name: str) -> float:
+def start_timer(name: str) -> int:
     """Start a timer"""
     return _metrics.start_timer(name)
 
 
-def stop_timer(name: str, start_time: float, labels: Optional[Dict] = None) -> float:
+def stop_timer(name: str, start_time: int, labels: Optional[Dict] = None) -> float:
     """Stop a timer and return duration in ms"""
     return _metrics.stop_timer(name, start_time, labels)
 
@@ -233,6 +248,11 @@ def record_histogram(name: str, value: float, labels: Optional[Dict] = None):
     _metrics.record_histogram(name, value, labels)
 
 
+def record_histogram_batch(name: str, values: Iterable[float], labels: Optional[Dict] = None):
+    """Record many histogram values at once"""
+    _metrics.record_histogram_batch(name, values, labels)
+
+
 def get_metrics() -> MetricsCollector:
     """Get global metrics instance"""
     return _metrics
@@ -20,6 +20,14 @@ import requests
 from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
 
+# Optional fast JSON backend for request/response bodies
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
 logger = logging.getLogger(__name__)
@@ -128,6 +136,16 @@ class N8nApiClient:
 
         logger.debug(f"Initialized n8n API client for {self.api_url}")
 
+    def close(self) -> None:
+        """Close the underlying HTTP session and release pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> "N8nApiClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
     def _check_rate_limit(self):
         """Check and enforce rate limiting."""
         now = time.time()
@@ -174,9 +192,19 @@ class N8nApiClient:
 
         try:
             logger.debug(f"{method} {url}")
-            response = self.session.request(
-                method=method, url=url, json=data, params=params, timeout=self.timeout
-            )
+            if ORJSON_AVAILABLE and data is not None:
+                # Session already sends Content-Type: application/json
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    data=orjson.dumps(data),
+                    params=params,
+                    timeout=self.timeout,
+                )
+            else:
+                response = self.session.request(
+                    method=method, url=url, json=data, params=params, timeout=self.timeout
+                )
 
             # Handle authentication errors
             if response.status_code == 401:
@@ -191,6 +219,8 @@ class N8nApiClient:
 
             # Return JSON response if available
             if response.content:
+                if ORJSON_AVAILABLE:
+                    return orjson.loads(response.content)
                 return response.json()
             return {}
 
@@ -348,8 +378,8 @@ class N8nApiClient:
         if "connections" not in workflow_data:
             raise N8nValidationError("Workflow must contain 'connections' field")
 
-        # Set active status
-        workflow_data["active"] = activate
+        # Set active status on a copy so the caller's workflow is left untouched
+        workflow_data = {**workflow_data, "active": activate}
 
         try:
             response = self._request("POST", "/workflows", data=workflow_data)
@@ -10,26 +10,146 @@ Created: 2025-11-20
 Issue: #12 - Workflow Versioning Strategy
 """
 
+import functools
 import hashlib
 import json
 import logging
-import uuid
-from collections import defaultdict
-from dataclasses import asdict, dataclass, field
+import re
+import sys
+import time
+from bisect import bisect_right
+from dataclasses import dataclass, field
 from datetime import datetime
-from difflib import unified_diff
-from typing import Any, Dict, List, Optional, Tuple
+from itertools import chain
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, TextIO, Tuple
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
 logger = logging.getLogger(__name__)
 
+# Top-level workflow fields that change without the workflow content changing
+_CHECKSUM_VOLATILE_FIELDS = frozenset(
+    ("createdAt", "updatedAt", "id", "versionId", "updatedBy", "meta")
+)
 
-@dataclass
+# MAJOR.MINOR.PATCH with ASCII digits only
+_SEMVER_PATTERN = re.compile(r"([0-9]+)\.([0-9]+)\.([0-9]+)")
+
+# Node fields ignored when detecting semantic node changes
+_VOLATILE_NODE_FIELDS = frozenset(("id", "webhookId", "createdAt", "updatedAt"))
+
+# dataclass(slots=True) needs Python 3.10+; fall back to a regular dataclass
+_DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Last formatted UTC second as an immutable (epoch_second, "YYYY-MM-DDTHH:MM:SS")
+# pair. Replaced with a single assignment so concurrent readers never see a
+# second paired with another second's prefix.
+_utcnow_cache: Tuple[int, str] = (-1, "")
+
+
+def _utcnow_iso() -> str:
+    """
+    Return the current UTC time as an ISO-8601 string with a "Z" suffix.
+
+    The date/time prefix is formatted with C strftime and cached per second,
+    so stamping many versions in a tight loop only formats the microseconds.
+    """
+    global _utcnow_cache
+    now = time.time()
+    second = int(now)
+    cached_second, prefix = _utcnow_cache
+    if second != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        _utcnow_cache = (second, prefix)
+    return f"{prefix}.{int((now - second) * 1_000_000):06d}Z"
+
+
+def _new_uuid() -> str:
+    """Return a random UUID string, importing uuid only on first use."""
+    import uuid
+
+    return str(uuid.uuid4())
+
+
+def _dumps_canonical(obj: Any) -> bytes:
+    """
+    Serialize to key-sorted JSON bytes for checksumming.
+
+    Uses the stdlib encoder's default separators and ASCII escaping, so the
+    hashed bytes match json.dumps(obj, sort_keys=True) and lone surrogates
+    (valid in parsed JSON) are escaped rather than failing to encode.
+    """
+    return json.dumps(obj, sort_keys=True).encode()
+
+
+def _dumps_sorted_indent(obj: Any) -> str:
+    """
+    Serialize to indented, key-sorted JSON for line diffs.
+
+    Always uses the stdlib encoder: orjson escapes non-ASCII text, formats
+    floats and encodes NaN differently, so diffs would depend on whether it
+    is installed (and NaN -> None would not show up as a change).
+    """
+    return json.dumps(obj, indent=2, sort_keys=True)
+
+
+def _structural_diff(old: Any, new: Any, path: str = "") -> Iterator[str]:
+    """
+    Yield one line per differing JSON path between two values.
+
+    Lines are prefixed with '+' (added), '-' (removed) or '~' (changed).
+    Dicts are compared by key and lists by index, so the cost is linear in
+    the size of the inputs.
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in sorted(old.keys() | new.keys(), key=str):
+            child = f"{path}.{key}" if path else str(key)
+            if key not in new:
+                yield f"- {child}: {json.dumps(old[key], sort_keys=True)}\n"
+            elif key not in old:
+                yield f"+ {child}: {json.dumps(new[key], sort_keys=True)}\n"
+            else:
+                yield from _structural_diff(old[key], new[key], child)
+    elif isinstance(old, list) and isinstance(new, list):
+        for index in range(max(len(old), len(new))):
+            child = f"{path}[{index}]"
+            if index >= len(new):
+                yield f"- {child}: {json.dumps(old[index], sort_keys=True)}\n"
+            elif index >= len(old):
+                yield f"+ {child}: {json.dumps(new[index], sort_keys=True)}\n"
+            else:
+                yield from _structural_diff(old[index], new[index], child)
+    elif old != new or type(old) is not type(new):
+        yield (
+            f"~ {path}: {json.dumps(old, sort_keys=True)} -> "
+            f"{json.dumps(new, sort_keys=True)}\n"
+        )
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_version(version_string: str) -> Tuple[int, int, int]:
+    """Cached implementation of WorkflowVersion.parse_version"""
+    match = _SEMVER_PATTERN.fullmatch(version_string)
+    if not match:
+        raise ValueError(
+            f"Invalid version string '{version_string}': "
+            "must be exactly 3 numeric parts (MAJOR.MINOR.PATCH)"
+        )
+    return int(match[1]), int(match[2]), int(match[3])
+
+
+def _connection_target_key(target: Any) -> str:
+    """Sort key giving connection targets a stable, order-independent ordering"""
+    return json.dumps(target, sort_keys=True)
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class WorkflowVersion:
     """
     Represents a version of an n8n workflow with semantic versioning.
 
+    Instances are immutable once created.
+
     Semantic Versioning Format: MAJOR.MINOR.PATCH
     - MAJOR: Incompatible API changes (breaking changes)
     - MINOR: Backward-compatible functionality additions
@@ -44,28 +164,70 @@ class WorkflowVersion:
         created_at: Timestamp of version creation
         created_by: Author/system that created this version
         metadata: Additional version metadata
-        checksum: SHA-256 hash of workflow content
+        checksum: BLAKE2b hash of workflow content ("b2:"-prefixed)
     """
 
     version: str
-    version_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    version_id: str = field(default_factory=_new_uuid)
     workflow_id: Optional[str] = None
     workflow_name: str = "Unnamed Workflow"
     changelog: List[str] = field(default_factory=list)
-    created_at: str = field(default_factory=lambda: datetime.utcnow().isoformat() + "Z")
+    created_at: str = field(default_factory=_utcnow_iso)
     created_by: str = "Project Automata"
     metadata: Dict[str, Any] = field(default_factory=dict)
     checksum: Optional[str] = None
+    _parsed: Optional[Tuple[int, int, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        """Intern strings that repeat across the versions of a workflow"""
+        for name in ("version", "workflow_id", "workflow_name", "created_by"):
+            value = getattr(self, name)
+            if isinstance(value, str):
+                object.__setattr__(self, name, sys.intern(value))
 
     def to_dict(self) -> Dict:
-        """Convert to dictionary representation"""
-        return asdict(self)
+        """
+        Convert to dictionary representation.
+
+        The changelog list and metadata dict are shallow-copied rather than
+        deep-copied via asdict(); nested metadata values are shared.
+        """
+        return {
+            "version": self.version,
+            "version_id": self.version_id,
+            "workflow_id": self.workflow_id,
+            "workflow_name": self.workflow_name,
+            "changelog": list(self.changelog),
+            "created_at": self.created_at,
+            "created_by": self.created_by,
+            "metadata": dict(self.metadata),
+            "checksum": self.checksum,
+        }
+
+    def parsed(self) -> Tuple[int, int, int]:
+        """
+        Return the parsed (major, minor, patch) tuple for this version.
+
+        The result is computed once and cached, so sorting and comparing
+        versions does not re-split the version string on every call.
+        """
+        parsed = self._parsed
+        if parsed is None:
+            parsed = WorkflowVersion.parse_version(self.version)
+            # Frozen dataclass: bypass __setattr__ to fill the private cache
+            object.__setattr__(self, "_parsed", parsed)
+        return parsed
 
     @staticmethod
     def parse_version(version_string: str) -> Tuple[int, int, int]:
         """
         Parse semantic version string into components.
 
+        Results are memoized, so repeated parses of the same string are
+        a cache lookup.
+
         Args:
             version_string: Version string (e.g., "1.2.3")
 
@@ -75,15 +237,9 @@ class WorkflowVersion:
         Raises:
             ValueError: If version string is invalid
         """
-        try:
-            parts = version_string.split(".")
-            if len(parts) != 3:
-                raise ValueError("Version must have exactly 3 parts (MAJOR.MINOR.PATCH)")
-
-            major, minor, patch = map(int, parts)
-            return major, minor, patch
-        except Exception as e:
-            raise ValueError(f"Invalid version string '{version_string}': {e}")
+        if not isinstance(version_string, str):
+            raise ValueError(f"Invalid version string '{version_string}': must be a string")
+        return _parse_version(version_string)
 
     @staticmethod
     def format_version(major: int, minor: int, patch: int) -> str:
@@ -120,8 +276,15 @@ class WorkflowVersionManager:
 
     def __init__(self):
         """Initialize version manager"""
-        # Use defaultdict(list) to avoid race condition in check-then-act pattern
-        self.versions: Dict[str, List[WorkflowVersion]] = defaultdict(list)
+        # Populated via setdefault() so reads never auto-insert empty entries.
+        # Each list is kept sorted ascending by semantic version; equal
+        # versions stay in insertion order. Treat it as read-only and add
+        # versions through create_version() or version_bump().
+        self.versions: Dict[str, List[WorkflowVersion]] = {}
+        # Parallel lists of parsed version tuples used as bisect keys.
+        # Invariant: _sort_keys[wid][i] == versions[wid][i].parsed(), so any
+        # code that inserts or removes a version must update both lists.
+        self._sort_keys: Dict[str, List[Tuple[int, int, int]]] = {}
         logger.debug("Initialized WorkflowVersionManager")
 
     def create_version(
@@ -131,6 +294,7 @@ class WorkflowVersionManager:
         changelog: Optional[List[str]] = None,
         workflow_id: Optional[str] = None,
         created_by: str = "Project Automata",
+        now: Optional[str] = None,
     ) -> WorkflowVersion:
         """
         Create a new workflow version.
@@ -141,12 +305,21 @@ class WorkflowVersionManager:
             changelog: List of changes
             workflow_id: Optional workflow ID
             created_by: Version author
+            now: Optional ISO-8601 creation timestamp, e.g. one shared
+                timestamp for a bulk import (default: current UTC time)
 
         Returns:
             WorkflowVersion instance
+
+        Raises:
+            ValueError: If version is not a valid semantic version string
         """
         workflow_name = workflow.get("name", "Unnamed Workflow")
-        workflow_id = workflow_id or workflow.get("id") or str(uuid.uuid4())
+        workflow_id = workflow_id or workflow.get("id") or _new_uuid()
+
+        # Intern the key so it is the same object as the interned workflow_id
+        if isinstance(workflow_id, str):
+            workflow_id = sys.intern(workflow_id)
 
         # Calculate checksum
         checksum = self._calculate_checksum(workflow)
@@ -157,6 +330,7 @@ class WorkflowVersionManager:
             workflow_id=workflow_id,
             workflow_name=workflow_name,
             changelog=changelog or [],
+            created_at=now or _utcnow_iso(),
             created_by=created_by,
             checksum=checksum,
         )
@@ -166,8 +340,12 @@ class WorkflowVersionManager:
         if errors:
             logger.warning(f"Version validation warnings: {', '.join(errors)}")
 
-        # Store (defaultdict(list) automatically creates list if key doesn't exist)
-        self.versions[workflow_id].append(version_obj)
+        # Store in sorted position (setdefault creates the lists if missing)
+        sort_key = version_obj.parsed()
+        keys = self._sort_keys.setdefault(workflow_id, [])
+        index = bisect_right(keys, sort_key)
+        keys.insert(index, sort_key)
+        self.versions.setdefault(workflow_id, []).insert(index, version_obj)
 
         logger.debug(f"Created version {version} for workflow '{workflow_name}'")
         return version_obj
@@ -178,6 +356,7 @@ class WorkflowVersionManager:
         bump_type: str = "patch",
         changelog: Optional[List[str]] = None,
         workflow_id: Optional[str] = None,
+        now: Optional[str] = None,
     ) -> WorkflowVersion:
         """
         Automatically bump version based on change type.
@@ -187,6 +366,7 @@ class WorkflowVersionManager:
             bump_type: Type of bump ('major', 'minor', 'patch')
             changelog: List of changes
             workflow_id: Optional workflow ID
+            now: Optional ISO-8601 creation timestamp (see create_version)
 
         Returns:
             New WorkflowVersion instance
@@ -200,12 +380,12 @@ class WorkflowVersionManager:
                 f"Invalid bump_type: {bump_type}. Must be 'major', 'minor', or 'patch'"
             )
 
-        workflow_id = workflow_id or workflow.get("id") or str(uuid.uuid4())
+        workflow_id = workflow_id or workflow.get("id") or _new_uuid()
 
         # Get current version or default to 0.0.0
         current_version = self.get_latest_version(workflow_id)
         if current_version:
-            major, minor, patch = WorkflowVersion.parse_version(current_version.version)
+            major, minor, patch = current_version.parsed()
         else:
             major, minor, patch = 0, 0, 0
 
@@ -223,13 +403,20 @@ class WorkflowVersionManager:
         new_version = WorkflowVersion.format_version(major, minor, patch)
 
         return self.create_version(
-            workflow=workflow, version=new_version, changelog=changelog, workflow_id=workflow_id
+            workflow=workflow,
+            version=new_version,
+            changelog=changelog,
+            workflow_id=workflow_id,
+            now=now,
         )
 
     def get_latest_version(self, workflow_id: str) -> Optional[WorkflowVersion]:
         """
         Get the latest version for a workflow.
 
+        If the same version string was created more than once, the most
+        recently created one is returned.
+
         Args:
             workflow_id: Workflow ID
 
@@ -237,20 +424,15 @@ class WorkflowVersionManager:
             Latest WorkflowVersion or None
         """
         versions = self.versions.get(workflow_id, [])
-        if not versions:
-            return None
-
-        # Sort by semantic version
-        sorted_versions = sorted(
-            versions, key=lambda v: WorkflowVersion.parse_version(v.version), reverse=True
-        )
-
-        return sorted_versions[0]
+        return versions[-1] if versions else None
 
     def get_version(self, workflow_id: str, version: str) -> Optional[WorkflowVersion]:
         """
         Get a specific version.
 
+        If the version string was created more than once, the first one
+        created is returned.
+
         Args:
             workflow_id: Workflow ID
             version: Version string
@@ -276,9 +458,7 @@ class WorkflowVersionManager:
             List of WorkflowVersion instances
         """
         versions = self.versions.get(workflow_id, [])
-        return sorted(
-            versions, key=lambda v: WorkflowVersion.parse_version(v.version), reverse=not ascending
-        )
+        return versions[:] if ascending else versions[::-1]
 
     def compare_versions(self, workflow_id: str, version1: str, version2: str) -> Dict[str, Any]:
         """
@@ -303,12 +483,8 @@ class WorkflowVersionManager:
         if not v2:
             raise ValueError(f"Version not found: {version2}")
 
-        # Parse versions
-        v1_parts = WorkflowVersion.parse_version(version1)
-        v2_parts = WorkflowVersion.parse_version(version2)
-
         # Determine which is newer
-        if v1_parts > v2_parts:
+        if v1.parsed() > v2.parsed():
             newer, older = v1, v2
             newer_str, older_str = version1, version2
         else:
@@ -318,7 +494,7 @@ class WorkflowVersionManager:
         comparison = {
             "newer_version": newer_str,
             "older_version": older_str,
-            "version_difference": self._calculate_version_diff(older_str, newer_str),
+            "version_difference": self._calculate_version_diff(older.parsed(), newer.parsed()),
             "changelog_combined": newer.changelog,
             "time_difference": self._calculate_time_diff(older.created_at, newer.created_at),
             "checksum_match": v1.checksum == v2.checksum if v1.checksum and v2.checksum else None,
@@ -326,32 +502,145 @@ class WorkflowVersionManager:
 
         return comparison
 
-    def generate_diff(self, workflow1: Dict, workflow2: Dict, context_lines: int = 3) -> str:
+    def generate_diff(
+        self,
+        workflow1: Dict,
+        workflow2: Dict,
+        context_lines: int = 3,
+        diff_algorithm: str = "unified",
+    ) -> str:
         """
-        Generate a unified diff between two workflows.
+        Generate a diff between two workflows.
 
         Args:
             workflow1: First workflow JSON
             workflow2: Second workflow JSON
-            context_lines: Number of context lines in diff
+            context_lines: Number of context lines in diff (unified only)
+            diff_algorithm: 'unified' for a line-based diff of the formatted
+                JSON, or 'structural' for a per-path diff that walks the JSON
+                tree directly and avoids difflib's quadratic line matching
 
         Returns:
-            Unified diff string
-        """
-        # Convert to formatted JSON strings
-        json1 = json.dumps(workflow1, indent=2, sort_keys=True).splitlines(keepends=True)
-        json2 = json.dumps(workflow2, indent=2, sort_keys=True).splitlines(keepends=True)
-
-        # Generate diff
-        diff = unified_diff(
-            json1,
-            json2,
-            fromfile=f"{workflow1.get('name', 'workflow')} (old)",
-            tofile=f"{workflow2.get('name', 'workflow')} (new)",
-            n=context_lines,
+            Diff string
+
+        Raises:
+            ValueError: If diff_algorithm is invalid
+        """
+        return "".join(
+            self.generate_diff_stream(workflow1, workflow2, context_lines, diff_algorithm)
         )
 
-        return "".join(diff)
+    def generate_diff_stream(
+        self,
+        workflow1: Dict,
+        workflow2: Dict,
+        context_lines: int = 3,
+        diff_algorithm: str = "unified",
+    ) -> Iterator[str]:
+        """
+        Generate a diff between two workflows line by line.
+
+        Unlike generate_diff, the diff text is never joined into one string,
+        so large diffs can be consumed incrementally (see write_diff).
+
+        Args:
+            workflow1: First workflow JSON
+            workflow2: Second workflow JSON
+            context_lines: Number of context lines in diff (unified only)
+            diff_algorithm: 'unified' or 'structural' (see generate_diff)
+
+        Returns:
+            Iterator of diff lines
+
+        Raises:
+            ValueError: If diff_algorithm is invalid
+        """
+        diff_algorithm = diff_algorithm.lower()
+        if diff_algorithm not in ["unified", "structural"]:
+            raise ValueError(
+                f"Invalid diff_algorithm: {diff_algorithm}. Must be 'unified' or 'structural'"
+            )
+
+        lines: Iterator[str]
+
+        # Identical workflows produce an empty diff; skip serialization entirely
+        if workflow1 == workflow2:
+            lines = iter(())
+        else:
+            fromfile = f"{workflow1.get('name', 'workflow')} (old)"
+            tofile = f"{workflow2.get('name', 'workflow')} (new)"
+
+            if diff_algorithm == "structural":
+                lines = chain(
+                    (f"--- {fromfile}\n", f"+++ {tofile}\n"),
+                    _structural_diff(workflow1, workflow2),
+                )
+            else:
+                # Imported lazily: difflib is only needed when a diff is requested
+                from difflib import unified_diff
+
+                # difflib needs sequences, so the formatted JSON is split up front
+                json1 = _dumps_sorted_indent(workflow1).splitlines(keepends=True)
+                json2 = _dumps_sorted_indent(workflow2).splitlines(keepends=True)
+
+                lines = unified_diff(
+                    json1,
+                    json2,
+                    fromfile=fromfile,
+                    tofile=tofile,
+                    n=context_lines,
+                )
+
+        return lines
+
+    def write_diff(
+        self,
+        workflow1: Dict,
+        workflow2: Dict,
+        out: TextIO,
+        context_lines: int = 3,
+        diff_algorithm: str = "unified",
+    ) -> None:
+        """
+        Write a diff between two workflows to a text stream, line by line.
+
+        Args:
+            workflow1: First workflow JSON
+            workflow2: Second workflow JSON
+            out: Text stream to write to
+            context_lines: Number of context lines in diff (unified only)
+            diff_algorithm: 'unified' or 'structural' (see generate_diff)
+
+        Raises:
+            ValueError: If diff_algorithm is invalid
+        """
+        out.writelines(
+            self.generate_diff_stream(workflow1, workflow2, context_lines, diff_algorithm)
+        )
+
+    def write_diff_bytes(
+        self,
+        workflow1: Dict,
+        workflow2: Dict,
+        out: BinaryIO,
+        context_lines: int = 3,
+        diff_algorithm: str = "unified",
+    ) -> None:
+        """
+        Write a UTF-8 encoded diff between two workflows to a binary stream.
+
+        Args:
+            workflow1: First workflow JSON
+            workflow2: Second workflow JSON
+            out: Binary stream to write to
+            context_lines: Number of context lines in diff (unified only)
+            diff_algorithm: 'unified' or 'structural' (see generate_diff)
+
+        Raises:
+            ValueError: If diff_algorithm is invalid
+        """
+        lines = self.generate_diff_stream(workflow1, workflow2, context_lines, diff_algorithm)
+        out.writelines(line.encode("utf-8") for line in lines)
 
     def detect_changes(self, workflow1: Dict, workflow2: Dict) -> Dict[str, Any]:
         """
@@ -374,26 +663,33 @@ class WorkflowVersionManager:
             "breaking_changes": False,
         }
 
+        # Fast path: identical workflows cannot have any changes
+        if workflow1 == workflow2:
+            return changes
+
+        # Normalize each workflow once, then compare canonical parts with ==
+        canonical1 = self._canonicalize_workflow(workflow1)
+        canonical2 = self._canonicalize_workflow(workflow2)
+
         # Compare nodes
-        nodes1 = {n["name"]: n for n in workflow1.get("nodes", [])}
-        nodes2 = {n["name"]: n for n in workflow2.get("nodes", [])}
+        nodes1 = canonical1["nodes"]
+        nodes2 = canonical2["nodes"]
 
         # Detect added/removed nodes
-        changes["nodes_added"] = list(set(nodes2.keys()) - set(nodes1.keys()))
-        changes["nodes_removed"] = list(set(nodes1.keys()) - set(nodes2.keys()))
+        # (dict key views support set operations without building temporary sets)
+        changes["nodes_added"] = list(nodes2.keys() - nodes1.keys())
+        changes["nodes_removed"] = list(nodes1.keys() - nodes2.keys())
 
         # Detect modified nodes
-        for name in set(nodes1.keys()) & set(nodes2.keys()):
+        for name in nodes1.keys() & nodes2.keys():
             if nodes1[name] != nodes2[name]:
                 changes["nodes_modified"].append(name)
 
         # Check connections
-        changes["connections_changed"] = workflow1.get("connections", {}) != workflow2.get(
-            "connections", {}
-        )
+        changes["connections_changed"] = canonical1["connections"] != canonical2["connections"]
 
         # Check settings
-        changes["settings_changed"] = workflow1.get("settings", {}) != workflow2.get("settings", {})
+        changes["settings_changed"] = canonical1["settings"] != canonical2["settings"]
 
         # Determine if breaking
         changes["breaking_changes"] = (
@@ -402,18 +698,23 @@ class WorkflowVersionManager:
 
         return changes
 
-    def suggest_version_bump(self, workflow1: Dict, workflow2: Dict) -> str:
+    def suggest_version_bump(
+        self, workflow1: Dict, workflow2: Dict, changes: Optional[Dict[str, Any]] = None
+    ) -> str:
         """
         Suggest version bump type based on changes.
 
         Args:
             workflow1: Original workflow
             workflow2: Modified workflow
+            changes: Optional result of detect_changes(workflow1, workflow2),
+                to avoid recomputing it when the caller already has it
 
         Returns:
             Suggested bump type ('major', 'minor', 'patch')
         """
-        changes = self.detect_changes(workflow1, workflow2)
+        if changes is None:
+            changes = self.detect_changes(workflow1, workflow2)
 
         if changes["breaking_changes"]:
             return "major"
@@ -428,6 +729,8 @@ class WorkflowVersionManager:
         version: str,
         version_id: Optional[str] = None,
         changelog: Optional[List[str]] = None,
+        now: Optional[str] = None,
+        inplace: bool = False,
     ) -> Dict:
         """
         Add version metadata to workflow JSON.
@@ -437,31 +740,59 @@ class WorkflowVersionManager:
             version: Version string
             version_id: Optional version UUID
             changelog: Optional changelog
+            now: Optional ISO-8601 timestamp for updatedAt
+                (default: current UTC time)
+            inplace: Modify and return the given workflow (and its meta dict)
+                instead of a copy; the caller must own the dict
 
         Returns:
             Workflow with version metadata added
         """
-        workflow = workflow.copy()
+        version_id = version_id or _new_uuid()
 
-        # Add version fields
-        workflow["version"] = version
-        workflow["versionId"] = version_id or str(uuid.uuid4())
+        if inplace:
+            workflow["version"] = version
+            workflow["versionId"] = version_id
+        else:
+            # Single shallow copy with the version fields overlaid
+            workflow = {**workflow, "version": version, "versionId": version_id}
 
         if changelog:
             workflow["changelog"] = changelog
 
         # Update updatedAt
-        workflow["updatedAt"] = datetime.utcnow().isoformat() + "Z"
-
-        # Add to meta
-        if "meta" not in workflow:
-            workflow["meta"] = {}
+        workflow["updatedAt"] = now or _utcnow_iso()
 
-        workflow["meta"]["version"] = version
-        workflow["meta"]["versionId"] = workflow["versionId"]
+        # Add to meta (copied unless inplace, so the caller's meta is untouched)
+        meta = workflow.get("meta") or {}
+        if not inplace:
+            meta = dict(meta)
+        meta["version"] = version
+        meta["versionId"] = version_id
+        workflow["meta"] = meta
 
         return workflow
 
+    def iter_version_history(
+        self, workflow_id: str, ascending: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the dict form of each version of a workflow.
+
+        Dicts are produced one at a time, so long histories can be streamed
+        to a serializer without holding every dict in memory.
+
+        Args:
+            workflow_id: Workflow ID
+            ascending: Sort order (default: descending/newest first)
+
+        Returns:
+            Iterator of version dicts
+        """
+        versions = self.versions.get(workflow_id, [])
+        for version in versions if ascending else reversed(versions):
+            yield version.to_dict()
+
     def export_version_history(self, workflow_id: str) -> Dict:
         """
         Export complete version history for a workflow.
@@ -472,47 +803,91 @@ class WorkflowVersionManager:
         Returns:
             Version history dict
         """
-        versions = self.list_versions(workflow_id)
+        # Stored list is sorted ascending; read it directly instead of copying
+        versions = self.versions.get(workflow_id, [])
 
         history = {
             "workflow_id": workflow_id,
-            "workflow_name": versions[0].workflow_name if versions else "Unknown",
+            "workflow_name": versions[-1].workflow_name if versions else "Unknown",
             "total_versions": len(versions),
-            "latest_version": versions[0].version if versions else None,
-            "first_version": versions[-1].version if versions else None,
-            "versions": [v.to_dict() for v in versions],
-            "exported_at": datetime.utcnow().isoformat() + "Z",
+            "latest_version": versions[-1].version if versions else None,
+            "first_version": versions[0].version if versions else None,
+            "versions": list(self.iter_version_history(workflow_id)),
+            "exported_at": _utcnow_iso(),
         }
 
         return history
 
     def _calculate_checksum(self, workflow: Dict) -> str:
         """
-        Calculate SHA-256 checksum of workflow.
+        Calculate BLAKE2b checksum of workflow.
 
         Excludes volatile fields (timestamps, IDs, metadata) to ensure
         checksum only changes when actual workflow content changes.
+        The digest is prefixed with its algorithm ("b2:") so it can never
+        be mistaken for a legacy SHA-256 checksum.
         """
-        # Create a copy to avoid modifying the original
-        workflow_copy = workflow.copy()
-
-        # Remove volatile fields that change even when content doesn't
-        volatile_fields = ['createdAt', 'updatedAt', 'id', 'versionId', 'updatedBy']
-        for field in volatile_fields:
-            workflow_copy.pop(field, None)
+        # Filter out volatile fields in one pass (the original is never modified)
+        content = {k: v for k, v in workflow.items() if k not in _CHECKSUM_VOLATILE_FIELDS}
+
+        hasher = hashlib.blake2b(digest_size=16)
+        if all(isinstance(key, str) for key in content):
+            # Feed the hash one top-level value at a time. The bytes are identical
+            # to _dumps_canonical(content), but the full serialized workflow is
+            # never held in memory at once.
+            hasher.update(b"{")
+            for index, key in enumerate(sorted(content)):
+                if index:
+                    hasher.update(b", ")
+                hasher.update(_dumps_canonical(key))
+                hasher.update(b": ")
+                hasher.update(_dumps_canonical(content[key]))
+            hasher.update(b"}")
+        else:
+            hasher.update(_dumps_canonical(content))
 
-        # Also remove meta object which contains volatile metadata
-        workflow_copy.pop('meta', None)
+        return f"b2:{hasher.hexdigest()}"
 
-        # Calculate checksum on cleaned workflow
-        workflow_str = json.dumps(workflow_copy, sort_keys=True)
-        return hashlib.sha256(workflow_str.encode()).hexdigest()
+    def _canonicalize_workflow(self, workflow: Dict) -> Dict[str, Any]:
+        """
+        Build the canonical form of a workflow used for change detection.
 
-    def _calculate_version_diff(self, version1: str, version2: str) -> Dict[str, int]:
-        """Calculate difference between two versions"""
-        v1_parts = WorkflowVersion.parse_version(version1)
-        v2_parts = WorkflowVersion.parse_version(version2)
+        Nodes are keyed by name with volatile fields (IDs, webhook IDs,
+        timestamps) stripped, and connections are normalized so that target
+        ordering within an output does not register as a change.
+        """
+        return {
+            "nodes": {
+                node["name"]: {k: v for k, v in node.items() if k not in _VOLATILE_NODE_FIELDS}
+                for node in workflow.get("nodes", [])
+            },
+            "connections": self._normalize_connections(workflow.get("connections") or {}),
+            "settings": workflow.get("settings") or {},
+        }
 
+    def _normalize_connections(self, connections: Dict) -> Dict:
+        """Sort the targets of every connection output into a stable order"""
+        normalized: Dict[str, Any] = {}
+        for source, outputs in connections.items():
+            if not isinstance(outputs, dict):
+                normalized[source] = outputs
+                continue
+            normalized[source] = {
+                conn_type: [
+                    # Most outputs have a single target, which needs no sorting
+                    sorted(targets, key=_connection_target_key)
+                    if targets and len(targets) > 1
+                    else list(targets or [])
+                    for targets in output_list or []
+                ]
+                for conn_type, output_list in outputs.items()
+            }
+        return normalized
+
+    def _calculate_version_diff(
+        self, v1_parts: Tuple[int, int, int], v2_parts: Tuple[int, int, int]
+    ) -> Dict[str, int]:
+        """Calculate difference between two parsed (major, minor, patch) versions"""
         return {
             "major": v2_parts[0] - v1_parts[0],
             "minor": v2_parts[1] - v1_parts[1],
@@ -559,7 +934,10 @@ def create_versioned_workflow(
 
 
 def bump_workflow_version(
-    workflow: Dict, bump_type: str = "patch", changelog: Optional[List[str]] = None
+    workflow: Dict,
+    bump_type: str = "patch",
+    changelog: Optional[List[str]] = None,
+    now: Optional[str] = None,
 ) -> Dict:
     """
     Bump workflow version.
@@ -568,6 +946,7 @@ def bump_workflow_version(
         workflow: Workflow JSON
         bump_type: Type of bump ('major', 'minor', 'patch')
         changelog: List of changes
+        now: Optional ISO-8601 timestamp for updatedAt
 
     Returns:
         Workflow with bumped version
@@ -589,9 +968,9 @@ def bump_workflow_version(
         patch += 1
 
     new_version = WorkflowVersion.format_version(major, minor, patch)
-    version_id = str(uuid.uuid4())
+    version_id = _new_uuid()
 
-    return manager.add_version_to_workflow(workflow, new_version, version_id, changelog)
+    return manager.add_version_to_workflow(workflow, new_version, version_id, changelog, now=now)
 
 
 if __name__ == "__main__":
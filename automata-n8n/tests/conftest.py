@@ -0,0 +1,64 @@
+"""
+Shared pytest fixtures for the test suite
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture(scope="session")
+def workflows():
+    """
+    Fixture providing the canonical test workflows, keyed by name.
+
+    Loaded once per session and shared, so tests must not mutate them;
+    use copy.deepcopy() on an entry before changing it.
+    """
+    data = (FIXTURES_DIR / "workflows.json").read_bytes()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@pytest.fixture(scope="session")
+def n8n_client():
+    """
+    Fixture providing one n8n API client for the whole session.
+
+    The client module is imported lazily so suites that never request this
+    fixture do not need its HTTP dependencies installed.
+    """
+    # PRODUCTION SAFETY CHECK: never run live tests against production
+    api_url = os.getenv("N8N_API_URL", "").lower()
+    if any(word in api_url for word in ["prod", "production", "live"]):
+        pytest.exit(
+            "DANGER: Cannot run integration tests against production environment!", returncode=1
+        )
+
+    n8n_api_client = pytest.importorskip("skills.n8n_api_client")
+    client = n8n_api_client.create_client_from_env()
+    if not client:
+        pytest.skip("Could not create n8n client from environment")
+    with client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def n8n_connection_test(n8n_client):
+    """Test n8n connection once before running tests that need it."""
+    ok, msg = n8n_client.test_connection()
+    if not ok:
+        pytest.skip(f"n8n connection failed: {msg}")
+    return ok
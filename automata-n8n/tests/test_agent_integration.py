@@ -7,346 +7,285 @@ Author: Project Automata - Tester Agent
 Version: 1.0.0
 """
 
-import os
-import sys
+import asyncio
+import json
 
 import pytest
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+pytest.importorskip("agents", reason="Agent modules not available")
 
-try:
-    from agents import AgentResult, AgentTask, BaseAgent
-    from agents.documenter import DocumenterAgent
-    from agents.engineer import EngineerAgent
-    from agents.project_manager import ProjectManagerAgent
-    from agents.researcher import ResearcherAgent
-    from agents.tester import TesterAgent
-    from agents.validator import ValidatorAgent
-except ImportError:
-    pytest.skip("Agent modules not available", allow_module_level=True)
+from agents import AgentResult, AgentTask, BaseAgent
+from agents.documenter import DocumenterAgent
+from agents.engineer import EngineerAgent
+from agents.project_manager import ProjectManagerAgent
+from agents.researcher import ResearcherAgent
+from agents.tester import TesterAgent
+from agents.validator import ValidatorAgent
 
 
 class TestBaseAgent:
     """Test suite for BaseAgent functionality"""
 
-    def test_agent_initialization(self):
+    def test_agent_initialization(self, researcher):
         """Test that agents can be initialized"""
         # We can't instantiate BaseAgent directly, so test with concrete agent
-        agent = ResearcherAgent()
-        assert agent.name == "Researcher"
-        assert agent.task_count == 0
+        assert researcher.name == "Researcher"
+        assert researcher.task_count == 0
 
-    def test_agent_performance_tracking(self):
+    def test_agent_performance_tracking(self, researcher):
         """Test agent performance statistics"""
-        agent = ResearcherAgent()
-        agent.update_stats(success=True)
-        agent.update_stats(success=True)
-        agent.update_stats(success=False)
+        researcher.update_stats(success=True)
+        researcher.update_stats(success=True)
+        researcher.update_stats(success=False)
 
-        perf = agent.get_performance()
+        perf = researcher.get_performance()
         assert perf["tasks_completed"] == 3
         assert perf["successes"] == 2
         assert perf["errors"] == 1
 
+    def test_agent_performance_tracking_batch(self, researcher):
+        """Test batched agent performance statistics"""
+        researcher.update_stats_batch(2, 1)
+
+        perf = researcher.get_performance()
+        assert perf["tasks_completed"] == 3
+        assert perf["successes"] == 2
+        assert perf["errors"] == 1
+
+        with pytest.raises(ValueError):
+            researcher.update_stats_batch(-1, 0)
+
+    def test_agent_performance_cached(self, researcher):
+        """Test cached performance metrics are returned as independent dicts"""
+        p1 = researcher.get_performance()
+        p1["errors"] = 99
+        p2 = researcher.get_performance()
+        assert type(p2) is dict
+        assert p2 is not p1
+        assert p2["errors"] == 0
+        assert json.loads(json.dumps(p2)) == p2
+
+        researcher.update_stats(success=True)
+        p3 = researcher.get_performance()
+        assert p3["tasks_completed"] == 1
+        assert p3["success_rate"] == "100.0%"
+
 
 class TestResearcherAgent:
     """Test suite for ResearcherAgent"""
 
-    def test_researcher_initialization(self):
+    def test_researcher_initialization(self, researcher):
         """Test researcher agent initialization"""
-        agent = ResearcherAgent()
-        assert agent.name == "Researcher"
-        assert len(agent.patterns) == 0
+        assert researcher.name == "Researcher"
+        assert len(researcher.patterns) == 0
+
+    def test_knowledge_summary_copies_performance(self, researcher):
+        """Test editing the knowledge summary leaves agent metrics untouched"""
+        summary = researcher.get_knowledge_summary()
+        summary["agent_performance"]["tasks_completed"] = 99
 
-    def test_researcher_find_patterns(self):
+        assert researcher.get_performance()["tasks_completed"] == 0
+
+    def test_researcher_find_patterns(self, researcher, make_task):
         """Test pattern finding task"""
-        agent = ResearcherAgent()
-        task = AgentTask(task_id="research_001", task_type="find_patterns", parameters={})
+        task = make_task("find_patterns", task_id="research_001")
 
-        result = agent.execute(task)
-        assert result.success == True
+        result = researcher.execute(task)
+        assert result.success
         assert "patterns" in result.output
         assert len(result.output["patterns"]) > 0
 
-    def test_researcher_mine_docs(self):
+    def test_researcher_mine_docs(self, researcher, make_task):
         """Test documentation mining"""
-        agent = ResearcherAgent()
-        task = AgentTask(task_id="research_002", task_type="mine_docs", parameters={})
+        task = make_task("mine_docs", task_id="research_002")
 
-        result = agent.execute(task)
-        assert result.success == True
+        result = researcher.execute(task)
+        assert result.success
         assert "items" in result.output
 
-    def test_researcher_summarize_node(self):
+    def test_researcher_summarize_node(self, researcher, make_task):
         """Test node summarization"""
-        agent = ResearcherAgent()
-        task = AgentTask(
-            task_id="research_003",
-            task_type="summarize_node",
-            parameters={"node_type": "n8n-nodes-base.webhook"},
+        task = make_task(
+            "summarize_node", task_id="research_003", node_type="n8n-nodes-base.webhook"
         )
 
-        result = agent.execute(task)
-        assert result.success == True
+        result = researcher.execute(task)
+        assert result.success
         assert "summary" in result.output
 
 
 class TestEngineerAgent:
     """Test suite for EngineerAgent"""
 
-    def test_engineer_initialization(self):
+    def test_engineer_initialization(self, engineer):
         """Test engineer agent initialization"""
-        agent = EngineerAgent()
-        assert agent.name == "Engineer"
-        assert len(agent.code_quality_rules) > 0
+        assert engineer.name == "Engineer"
+        assert len(engineer.code_quality_rules) > 0
 
-    def test_engineer_build_module(self):
+    def test_engineer_build_module(self, engineer, make_task):
         """Test module building"""
-        agent = EngineerAgent()
-        task = AgentTask(
-            task_id="eng_001",
-            task_type="build_module",
-            parameters={"name": "test_module", "type": "skill"},
-        )
+        task = make_task("build_module", task_id="eng_001", name="test_module", type="skill")
 
-        result = agent.execute(task)
-        assert result.success == True
+        result = engineer.execute(task)
+        assert result.success
         assert result.output["name"] == "test_module"
 
-    def test_engineer_code_review(self):
+    def test_engineer_code_review(self, engineer, make_task):
         """Test code review functionality"""
-        agent = EngineerAgent()
-        task = AgentTask(
-            task_id="eng_002",
-            task_type="review",
-            parameters={"code": 'def test():\n    """docstring"""\n    pass'},
+        task = make_task(
+            "review", task_id="eng_002", code='def test():\n    """docstring"""\n    pass'
         )
 
-        result = agent.execute(task)
-        assert result.success == True
+        result = engineer.execute(task)
+        assert result.success
         assert "quality_score" in result.output
 
 
 class TestValidatorAgent:
     """Test suite for ValidatorAgent"""
 
-    def test_validator_initialization(self):
+    def test_validator_initialization(self, validator):
         """Test validator agent initialization"""
-        agent = ValidatorAgent()
-        assert agent.name == "Validator"
+        assert validator.name == "Validator"
 
-    def test_validate_workflow(self):
+    def test_validate_workflow(self, validator, make_task, workflows):
         """Test workflow validation"""
-        agent = ValidatorAgent()
-
-        valid_workflow = {
-            "name": "Test",
-            "nodes": [
-                {
-                    "name": "Start",
-                    "type": "n8n-nodes-base.manualTrigger",
-                    "typeVersion": 1,
-                    "position": [240, 300],
-                    "parameters": {},
-                }
-            ],
-            "connections": {},
-        }
-
-        task = AgentTask(
-            task_id="val_001",
-            task_type="validate_workflow",
-            parameters={"workflow": valid_workflow},
-        )
+        task = make_task("validate_workflow", task_id="val_001", workflow=workflows["valid"])
 
-        result = agent.execute(task)
-        assert result.success == True
-        assert result.output["valid"] == True
+        result = validator.execute(task)
+        assert result.success
+        assert result.output["valid"]
 
-    def test_validate_invalid_workflow(self):
+    def test_validate_invalid_workflow(self, validator, make_task, workflows):
         """Test validation of invalid workflow"""
-        agent = ValidatorAgent()
+        # Missing nodes field
+        task = make_task("validate_workflow", task_id="val_002", workflow=workflows["invalid"])
 
-        invalid_workflow = {
-            "name": "Invalid"
-            # Missing nodes field
-        }
-
-        task = AgentTask(
-            task_id="val_002",
-            task_type="validate_workflow",
-            parameters={"workflow": invalid_workflow},
-        )
-
-        result = agent.execute(task)
-        assert result.success == False
+        result = validator.execute(task)
+        assert not result.success
         assert len(result.output["errors"]) > 0
 
 
 class TestTesterAgent:
     """Test suite for TesterAgent"""
 
-    def test_tester_initialization(self):
+    def test_tester_initialization(self, tester):
         """Test tester agent initialization"""
-        agent = TesterAgent()
-        assert agent.name == "Tester"
+        assert tester.name == "Tester"
 
-    def test_run_tests(self):
+    def test_run_tests(self, tester, make_task):
         """Test running test suite"""
-        agent = TesterAgent()
-        task = AgentTask(task_id="test_001", task_type="run_tests", parameters={"suite": "all"})
+        task = make_task("run_tests", task_id="test_001", suite="all")
 
-        result = agent.execute(task)
-        assert result.success == True
+        result = tester.execute(task)
+        assert result.success
         assert result.output["total_tests"] > 0
 
-    def test_simulate_workflow(self):
+    def test_simulate_workflow(self, tester, make_task, workflows):
         """Test workflow simulation"""
-        agent = TesterAgent()
-
-        workflow = {
-            "nodes": [
-                {"name": "Start", "type": "n8n-nodes-base.manualTrigger"},
-                {"name": "Action", "type": "n8n-nodes-base.noOp"},
-            ],
-            "connections": {"Start": {"main": [[{"node": "Action", "type": "main", "index": 0}]]}},
-        }
-
-        task = AgentTask(
-            task_id="test_002", task_type="simulate_workflow", parameters={"workflow": workflow}
-        )
+        task = make_task("simulate_workflow", task_id="test_002", workflow=workflows["simulation"])
 
-        result = agent.execute(task)
-        assert result.success == True
+        result = tester.execute(task)
+        assert result.success
         assert "execution_log" in result.output
 
 
 class TestDocumenterAgent:
     """Test suite for DocumenterAgent"""
 
-    def test_documenter_initialization(self):
+    def test_documenter_initialization(self, documenter):
         """Test documenter agent initialization"""
-        agent = DocumenterAgent()
-        assert agent.name == "Documenter"
+        assert documenter.name == "Documenter"
 
-    def test_generate_docs(self):
+    def test_generate_docs(self, documenter, make_task):
         """Test documentation generation"""
-        agent = DocumenterAgent()
-        task = AgentTask(
-            task_id="doc_001", task_type="generate_docs", parameters={"source": "test_module"}
-        )
+        task = make_task("generate_docs", task_id="doc_001", source="test_module")
 
-        result = agent.execute(task)
-        assert result.success == True
+        result = documenter.execute(task)
+        assert result.success
         assert "documentation" in result.output
 
-    def test_create_eval_report(self):
+    def test_create_eval_report(self, documenter, make_task):
         """Test evaluation report creation"""
-        agent = DocumenterAgent()
-        task = AgentTask(
+        task = make_task(
+            "eval_report",
             task_id="doc_002",
-            task_type="eval_report",
-            parameters={"cycle": 1, "metrics": {"schema_validity": 90, "test_pass_rate": 95}},
+            cycle=1,
+            metrics={"schema_validity": 90, "test_pass_rate": 95},
         )
 
-        result = agent.execute(task)
-        assert result.success == True
+        result = documenter.execute(task)
+        assert result.success
         assert "report" in result.output
 
 
 class TestProjectManagerAgent:
     """Test suite for ProjectManagerAgent"""
 
-    def test_pm_initialization(self):
+    def test_pm_initialization(self, project_manager):
         """Test PM agent initialization"""
-        agent = ProjectManagerAgent()
-        assert agent.name == "ProjectManager"
+        assert project_manager.name == "ProjectManager"
 
-    def test_plan_cycle(self):
+    def test_plan_cycle(self, project_manager, make_task):
         """Test cycle planning"""
-        agent = ProjectManagerAgent()
-        task = AgentTask(task_id="pm_001", task_type="plan_cycle", parameters={"cycle": 1})
+        task = make_task("plan_cycle", task_id="pm_001", cycle=1)
 
-        result = agent.execute(task)
-        assert result.success == True
+        result = project_manager.execute(task)
+        assert result.success
         assert "tasks" in result.output
         assert len(result.output["tasks"]) > 0
 
-    def test_track_progress(self):
+    def test_track_progress(self, project_manager, make_task):
         """Test progress tracking"""
-        agent = ProjectManagerAgent()
-        task = AgentTask(task_id="pm_002", task_type="track_progress", parameters={"cycle": 1})
+        task = make_task("track_progress", task_id="pm_002", cycle=1)
 
-        result = agent.execute(task)
-        assert result.success == True
+        result = project_manager.execute(task)
+        assert result.success
         assert "overall_progress" in result.output
 
-    def test_version_bump(self):
+    def test_version_bump(self, project_manager, make_task):
         """Test version bumping"""
-        agent = ProjectManagerAgent()
-        task = AgentTask(
-            task_id="pm_003",
-            task_type="version_bump",
-            parameters={"current": "1.0.0", "type": "minor"},
-        )
+        task = make_task("version_bump", task_id="pm_003", current="1.0.0", type="minor")
 
-        result = agent.execute(task)
-        assert result.success == True
+        result = project_manager.execute(task)
+        assert result.success
         assert result.output["new_version"] == "1.1.0"
 
 
 class TestMultiAgentCoordination:
     """Integration tests for multi-agent coordination"""
 
-    def test_agent_task_handoff(self):
+    def test_agent_task_handoff(self, researcher, engineer, make_task):
         """Test passing work between agents"""
         # Researcher finds patterns
-        researcher = ResearcherAgent()
-        research_task = AgentTask(task_id="coord_001", task_type="find_patterns", parameters={})
+        research_task = make_task("find_patterns", task_id="coord_001")
         research_result = researcher.execute(research_task)
 
         # Engineer could use those patterns to build
-        engineer = EngineerAgent()
         # (In real system, engineer would use research_result.output)
 
-        assert research_result.success == True
+        assert research_result.success
 
-    def test_validation_workflow(self):
+    def test_validation_workflow(self, validator, tester, make_task, workflows):
         """Test workflow validation pipeline"""
-        # Generate a workflow (simulated)
-        workflow = {
-            "name": "Test",
-            "nodes": [
-                {
-                    "name": "Start",
-                    "type": "n8n-nodes-base.manualTrigger",
-                    "typeVersion": 1,
-                    "position": [0, 0],
-                    "parameters": {},
-                }
-            ],
-            "connections": {},
-        }
-
-        # Validator checks it
-        validator = ValidatorAgent()
-        val_task = AgentTask(
-            task_id="coord_002", task_type="validate_workflow", parameters={"workflow": workflow}
-        )
-        val_result = validator.execute(val_task)
+        workflow = workflows["valid"]
 
-        # Tester simulates it
-        tester = TesterAgent()
-        test_task = AgentTask(
-            task_id="coord_003", task_type="simulate_workflow", parameters={"workflow": workflow}
-        )
-        test_result = tester.execute(test_task)
+        # Validator checks it while the tester simulates it (independent steps)
+        val_task = make_task("validate_workflow", task_id="coord_002", workflow=workflow)
+        test_task = make_task("simulate_workflow", task_id="coord_003", workflow=workflow)
+
+        async def run_pipeline():
+            return await asyncio.gather(validator.aexecute(val_task), tester.aexecute(test_task))
 
-        assert val_result.success == True
-        assert test_result.success == True
+        val_result, test_result = asyncio.run(run_pipeline())
+
+        assert val_result.success
+        assert test_result.success
 
 
 # Fixtures
+# Agents are stateful (task counters, learned patterns), so each test gets
+# a fresh instance; construction is only a few attribute assignments.
 @pytest.fixture
 def researcher():
     """Fixture providing ResearcherAgent"""
@@ -365,6 +304,30 @@ def validator():
     return ValidatorAgent()
 
 
-# Run tests
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
+@pytest.fixture
+def tester():
+    """Fixture providing TesterAgent"""
+    return TesterAgent()
+
+
+@pytest.fixture
+def documenter():
+    """Fixture providing DocumenterAgent"""
+    return DocumenterAgent()
+
+
+@pytest.fixture
+def project_manager():
+    """Fixture providing ProjectManagerAgent"""
+    return ProjectManagerAgent()
+
+
+@pytest.fixture
+def make_task():
+    """Fixture providing an AgentTask factory; keyword arguments become task parameters"""
+
+    def _make_task(task_type, task_id="task_001", **parameters):
+        return AgentTask(task_id=task_id, task_type=task_type, parameters=parameters)
+
+    return _make_task
+
@@ -15,13 +15,7 @@ Issue: #9 - Credential Management
 
 import unittest
 import json
-import tempfile
-import os
-from pathlib import Path
-import sys
-
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from unittest import mock
 
 from skills.credential_manager import (
     CredentialTemplate,
@@ -30,6 +24,7 @@ from skills.credential_manager import (
     create_credential,
     get_common_credential
 )
+from skills import credential_manager
 
 
 class TestCredentialTemplate(unittest.TestCase):
@@ -229,25 +224,54 @@ class TestCredentialManager(unittest.TestCase):
         errors = self.manager.validate_all()
         self.assertGreater(len(errors), 0)
 
+    def _save_manifest_text(self, use_orjson):
+        """Save the manifest with open() mocked and return (mode, written text)"""
+        m = mock.mock_open()
+        with mock.patch.object(credential_manager, "ORJSON_AVAILABLE", use_orjson), \
+                mock.patch.object(credential_manager, "open", m, create=True), \
+                mock.patch.object(credential_manager.os, "chmod") as chmod:
+            self.manager.save_manifest("manifest.json")
+
+        chmod.assert_called_once_with("manifest.json", 0o600)
+        chunks = [c.args[0] for c in m.return_value.write.call_args_list]
+        if use_orjson:
+            m.assert_called_once_with("manifest.json", "wb")
+            return b"".join(chunks).decode("utf-8")
+        m.assert_called_once_with("manifest.json", "w", encoding="utf-8")
+        return "".join(chunks)
+
     def test_save_manifest(self):
         """Test saving manifest to file"""
         self.manager.add_credential("Test", "postgresApi")
 
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
-            filepath = f.name
+        # Capture the written JSON in memory instead of round-tripping through disk
+        data = json.loads(self._save_manifest_text(credential_manager.ORJSON_AVAILABLE))
+
+        self.assertIn("credentials", data)
+        self.assertIn("total_credentials", data)
+
+    def test_save_manifest_json_fallback(self):
+        """Test the stdlib manifest keeps json.dump's default ASCII escaping"""
+        self.manager.add_credential("Test", "postgresApi", description="Zürich DB")
 
-        try:
-            self.manager.save_manifest(filepath)
-            self.assertTrue(os.path.exists(filepath))
+        text = self._save_manifest_text(False)
+        data = json.loads(text)
+        self.assertIn("Z\\u00fcrich DB", text)
+        self.assertEqual(data["credentials"][0]["description"], "Zürich DB")
 
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+        if credential_manager.ORJSON_AVAILABLE:
+            orjson_data = json.loads(self._save_manifest_text(True))
+            orjson_data.pop("exported_at")
+            data.pop("exported_at")
+            self.assertEqual(orjson_data, data)
 
-            self.assertIn("credentials", data)
-            self.assertIn("total_credentials", data)
-        finally:
-            if os.path.exists(filepath):
-                os.unlink(filepath)
+    def test_save_manifest_lone_surrogate(self):
+        """Test the stdlib manifest escapes a lone surrogate instead of failing"""
+        self.manager.add_credential("Test", "postgresApi", description="\ud800")
+
+        text = self._save_manifest_text(False)
+
+        self.assertIn("\\ud800", text)
 
 
 class TestCredentialLibrary(unittest.TestCase):
@@ -371,6 +395,3 @@ class TestConvenienceFunctions(unittest.TestCase):
         with self.assertRaises(ValueError):
             get_common_credential('invalid_service')
 
-
-if __name__ == '__main__':
-    unittest.main()
@@ -0,0 +1,75 @@
+"""
+Test Suite: Metrics Collection
+
+Tests for histogram recording and timer statistics in MetricsCollector
+"""
+
+import pytest
+
+from skills.metrics import MetricsCollector
+
+
+class TestHistograms:
+    """Histogram recording, single and batched"""
+
+    def test_record_histogram(self, collector):
+        """Test single histogram values are recorded in order"""
+        collector.record_histogram("latency", 1.0)
+        collector.record_histogram("latency", 2.5)
+
+        assert list(collector.timers["test_latency"]) == [1.0, 2.5]
+
+    def test_record_histogram_batch(self, collector):
+        """Test a batch records the same values as single calls"""
+        collector.record_histogram("latency", 1.0)
+        collector.record_histogram_batch("latency", (v for v in [2.0, 3.0]))
+
+        assert list(collector.timers["test_latency"]) == [1.0, 2.0, 3.0]
+
+    def test_record_histogram_batch_empty(self, collector):
+        """Test an empty batch creates the histogram without values"""
+        collector.record_histogram_batch("latency", [])
+
+        assert list(collector.timers["test_latency"]) == []
+        assert collector.get_timer_stats("latency") == {}
+
+    def test_record_histogram_batch_bounded(self, collector):
+        """Test batches keep only the newest 1000 values"""
+        collector.record_histogram("latency", -1.0)
+        collector.record_histogram_batch("latency", range(1500))
+
+        values = collector.timers["test_latency"]
+        assert values.maxlen == 1000
+        assert list(values) == list(range(500, 1500))
+
+
+class TestTimerStats:
+    """Aggregate statistics over recorded values"""
+
+    def test_get_timer_stats(self, collector):
+        """Test stats over batched values"""
+        collector.record_histogram_batch("latency", [2.0, 4.0, 6.0])
+
+        stats = collector.get_timer_stats("latency")
+        assert stats == {"count": 3, "min": 2.0, "max": 6.0, "avg": 4.0, "total": 12.0}
+
+    def test_get_timer_stats_unknown(self, collector):
+        """Test stats for a name that was never recorded"""
+        assert collector.get_timer_stats("missing") == {}
+
+    def test_stop_timer_records_duration(self, collector):
+        """Test stop_timer feeds the timer stats"""
+        start = collector.start_timer("op")
+        duration = collector.stop_timer("op", start)
+
+        stats = collector.get_timer_stats("op")
+        assert stats["count"] == 1
+        assert stats["total"] == duration >= 0
+
+
+# Fixtures
+@pytest.fixture
+def collector():
+    """Fixture providing a fresh MetricsCollector"""
+    return MetricsCollector(app_name="test")
+
@@ -0,0 +1,162 @@
+"""
+Test Suite: n8n API Client
+
+Offline tests for N8nApiClient. The HTTP session is mocked, so these run
+without an n8n instance (see test_n8n_integration.py for live tests).
+"""
+
+import json
+from unittest import mock
+
+import pytest
+
+requests = pytest.importorskip("requests")
+
+from skills import n8n_api_client
+from skills.n8n_api_client import N8nApiClient, N8nRateLimitError, N8nValidationError
+
+# Minimal importable workflow
+VALID_WORKFLOW = {
+    "name": "Test Workflow",
+    "nodes": [
+        {
+            "name": "Start",
+            "type": "n8n-nodes-base.start",
+            "typeVersion": 1,
+            "position": [250, 300],
+            "parameters": {},
+        }
+    ],
+    "connections": {},
+}
+
+
+def _response(status_code, body=b"{}"):
+    """Build a requests.Response without touching the network"""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    return response
+
+
+class TestConnection:
+    """Connection and authentication failures"""
+
+    def test_connection_with_invalid_key(self, offline_client):
+        """Test connection with invalid API key"""
+        with mock.patch.object(offline_client.session, "request", return_value=_response(401)):
+            ok, msg = offline_client.test_connection()
+
+        assert not ok
+        assert "authentication" in msg.lower()
+
+    def test_connection_with_invalid_url(self, offline_client):
+        """Test connection with unreachable URL"""
+        error = requests.exceptions.ConnectionError("Name or service not known")
+        with mock.patch.object(offline_client.session, "request", side_effect=error):
+            ok, msg = offline_client.test_connection()
+
+        assert not ok
+        assert "connection" in msg.lower()
+
+    def test_connection_success(self, offline_client):
+        """Test successful connection"""
+        response = _response(200, b'{"data": []}')
+        with mock.patch.object(offline_client.session, "request", return_value=response) as req:
+            ok, msg = offline_client.test_connection()
+
+        assert ok
+        assert req.call_args.kwargs["url"] == "http://n8n.test/api/v1/workflows"
+
+
+class TestJsonBodies:
+    """Request/response JSON handling"""
+
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+    def test_import_workflow_round_trip(self, offline_client, use_orjson):
+        """Test request body and response decode match with either JSON backend"""
+        if use_orjson and not n8n_api_client.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+
+        response = _response(200, '{"id": "1", "name": "Zürich"}'.encode("utf-8"))
+        with mock.patch.object(n8n_api_client, "ORJSON_AVAILABLE", use_orjson), \
+                mock.patch.object(offline_client.session, "request", return_value=response) as req:
+            result = offline_client.import_workflow(VALID_WORKFLOW)
+
+        assert result == {"id": "1", "name": "Zürich"}
+
+        kwargs = req.call_args.kwargs
+        body = json.loads(kwargs["data"]) if use_orjson else kwargs["json"]
+        assert body == {**VALID_WORKFLOW, "active": False}
+
+
+class TestWorkflowValidation:
+    """Local workflow validation (no requests are sent)"""
+
+    @pytest.mark.parametrize(
+        "workflow,expected_valid,error_substr",
+        [
+            (VALID_WORKFLOW, True, None),
+            ({"nodes": [], "connections": {}}, False, "name"),
+            ({"name": "Test", "connections": {}}, False, "nodes"),
+            ({"name": "Test", "nodes": [], "connections": {}}, False, "at least one node"),
+            # Node missing required fields
+            ({"name": "Test", "nodes": [{"name": "Node1"}], "connections": {}}, False, None),
+        ],
+        ids=["valid", "missing_name", "missing_nodes", "empty_nodes", "invalid_node_structure"],
+    )
+    def test_validate_workflow(self, offline_client, workflow, expected_valid, error_substr):
+        """Test validating workflows with and without required structure"""
+        is_valid, errors = offline_client.validate_workflow_import(workflow)
+
+        assert is_valid is expected_valid
+        assert (len(errors) == 0) is expected_valid
+        if error_substr:
+            assert any(error_substr in err.lower() for err in errors)
+
+    def test_import_invalid_workflow_fails(self, offline_client):
+        """Test that importing invalid workflow raises before any request"""
+        invalid_workflow = {"name": "Invalid"}  # Missing nodes and connections
+
+        with mock.patch.object(offline_client.session, "request") as req:
+            with pytest.raises(N8nValidationError):
+                offline_client.import_workflow(invalid_workflow)
+
+        req.assert_not_called()
+
+
+class TestRateLimiting:
+    """Client-side rate limiting"""
+
+    def test_rate_limit_enforcement(self):
+        """Test that rate limiting is enforced"""
+        # Strict limit on a fresh client so the shared fixture's budget is untouched
+        client = N8nApiClient(
+            api_url="http://n8n.test/api/v1",
+            api_key="test_key",
+            rate_limit_requests=5,
+            rate_limit_period=2,
+        )
+        response = _response(200, b'{"data": []}')
+
+        with client, mock.patch.object(client.session, "request", return_value=response) as req:
+            # Make 5 requests (should succeed)
+            for _ in range(5):
+                client.list_workflows(limit=1)
+
+            # 6th request should be rate limited before reaching the session
+            with pytest.raises(N8nRateLimitError):
+                client.list_workflows(limit=1)
+
+        assert req.call_count == 5
+
+
+# Fixtures
+# Shared per module: tests only patch the session temporarily, and the few
+# mocked requests stay well under the client's rate limit.
+@pytest.fixture(scope="module")
+def offline_client():
+    """Fixture providing an N8nApiClient pointed at a non-existent host"""
+    with N8nApiClient(api_url="http://n8n.test/api/v1", api_key="test_key") as client:
+        yield client
+
@@ -14,16 +14,11 @@ Created: 2025-11-20
 
 import json
 import logging
-import sys
 import time
-from pathlib import Path
 from typing import Tuple
 
 import pytest
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from skills.generate_workflow_json import TemplateLibrary, WorkflowBuilder
 from skills.nl_prompt_parser import parse_prompt
 from skills.parse_n8n_schema import parse_workflow_json
@@ -374,6 +369,3 @@ def pytest_runtest_makereport(item, call):
         if duration > 0.5:
             logger.warning(f"SLOW TEST: {item.name} took {duration:.3f}s")
 
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v", "--tb=short"])
@@ -9,13 +9,9 @@ Version: 1.0.0
 
 import json
 import os
-import sys
 
 import pytest
 
-# Add parent directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
-
 try:
     from skills.parse_n8n_schema import (
         N8nConnection,
@@ -34,7 +30,7 @@ class TestN8nSchemaParser:
     def test_parser_initialization(self):
         """Test parser can be initialized"""
         parser = N8nSchemaParser(strict_mode=True)
-        assert parser.strict_mode == True
+        assert parser.strict_mode
         assert parser.errors == []
         assert parser.warnings == []
 
@@ -83,7 +79,7 @@ class TestN8nSchemaParser:
             parameters={},
         )
 
-        assert node.is_trigger() == True
+        assert node.is_trigger()
 
     def test_workflow_with_connections(self):
         """Test parsing workflow with connections"""
@@ -157,7 +153,7 @@ class TestN8nSchemaParser:
 
         if result:
             has_cycle, cycle_path = result.has_circular_dependencies()
-            assert has_cycle == True
+            assert has_cycle
 
     def test_trigger_nodes_identification(self):
         """Test identification of trigger nodes"""
@@ -235,7 +231,7 @@ class TestNodeClassification:
             position=(0, 0),
             parameters={},
         )
-        assert node.is_trigger() == True
+        assert node.is_trigger()
 
     def test_action_classification(self):
         """Test action node classification"""
@@ -247,7 +243,7 @@ class TestNodeClassification:
             position=(0, 0),
             parameters={},
         )
-        assert node.is_trigger() == False
+        assert not node.is_trigger()
 
 
 # Test fixtures
@@ -274,7 +270,3 @@ def parser():
     """Fixture providing a parser instance"""
     return N8nSchemaParser(strict_mode=False)
 
-
-# Run tests
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
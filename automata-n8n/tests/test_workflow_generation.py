@@ -7,13 +7,8 @@ Author: Project Automata - Tester Agent
 Version: 1.0.0
 """
 
-import os
-import sys
-
 import pytest
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
-
 try:
     from skills.generate_workflow_json import (
         TemplateLibrary,
@@ -309,8 +304,8 @@ class TestWorkflowSchemaFields:
 
         settings = workflow["settings"]
         assert settings["executionOrder"] == "v1"
-        assert settings["saveExecutionProgress"] == False
-        assert settings["saveManualExecutions"] == True
+        assert settings["saveExecutionProgress"] is False
+        assert settings["saveManualExecutions"] is True
         assert settings["timezone"] == "UTC"
         assert settings["callerPolicy"] == "workflowsFromSameOwner"
 
@@ -342,7 +337,3 @@ class TestWorkflowSchemaFields:
         assert workflow1["versionId"] != workflow2["versionId"]
         assert workflow1["meta"]["instanceId"] != workflow2["meta"]["instanceId"]
 
-
-# Run tests
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
@@ -15,14 +15,17 @@ Issue: #12 - Workflow Versioning
 """
 
 import unittest
+import hashlib
+import io
 import json
-from pathlib import Path
+from dataclasses import FrozenInstanceError
+from datetime import datetime
 import sys
+from unittest import mock
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
+from skills import workflow_versioning
 from skills.workflow_versioning import (
+    _dumps_sorted_indent,
     WorkflowVersion,
     WorkflowVersionManager,
     create_versioned_workflow,
@@ -64,6 +67,15 @@ class TestWorkflowVersion(unittest.TestCase):
         with self.assertRaises(ValueError):
             WorkflowVersion.parse_version("1.2.3.4")
 
+        with self.assertRaises(ValueError):
+            WorkflowVersion.parse_version(None)
+
+        with self.assertRaises(ValueError):
+            WorkflowVersion.parse_version("-1.2.3")
+
+        with self.assertRaises(ValueError):
+            WorkflowVersion.parse_version("1.2.3\n")
+
     def test_format_version(self):
         """Test formatting version components"""
         version_str = WorkflowVersion.format_version(1, 2, 3)
@@ -104,6 +116,62 @@ class TestWorkflowVersion(unittest.TestCase):
         self.assertEqual(version_dict["version"], "1.0.0")
         self.assertIn("changelog", version_dict)
 
+    def test_to_dict_copies_containers(self):
+        """Test to_dict output can be mutated without affecting the version"""
+        version = WorkflowVersion(version="1.0.0", changelog=["Initial release"])
+
+        version_dict = version.to_dict()
+        version_dict["changelog"].append("Changed")
+
+        self.assertEqual(version.changelog, ["Initial release"])
+        self.assertEqual(
+            set(version_dict),
+            {"version", "version_id", "workflow_id", "workflow_name", "changelog",
+             "created_at", "created_by", "metadata", "checksum"}
+        )
+
+    def test_version_is_frozen(self):
+        """Test version fields cannot be reassigned"""
+        version = WorkflowVersion(version="1.0.0")
+
+        with self.assertRaises(FrozenInstanceError):
+            version.version = "2.0.0"
+
+    def test_parsed_is_cached(self):
+        """Test parsed() returns the cached version tuple"""
+        version = WorkflowVersion(version="1.2.3")
+
+        self.assertEqual(version.parsed(), (1, 2, 3))
+        self.assertIs(version.parsed(), version.parsed())
+        self.assertNotIn("_parsed", version.to_dict())
+
+    @unittest.skipIf(sys.version_info < (3, 10), "dataclass slots require Python 3.10+")
+    def test_uses_slots(self):
+        """Test versions carry no per-instance __dict__"""
+        version = WorkflowVersion(version="1.0.0")
+
+        self.assertFalse(hasattr(version, "__dict__"))
+
+    def test_created_at_is_utc_iso(self):
+        """Test default created_at is an ISO-8601 UTC timestamp"""
+        version = WorkflowVersion(version="1.0.0")
+
+        self.assertTrue(version.created_at.endswith("Z"))
+        parsed = datetime.fromisoformat(version.created_at.replace("Z", "+00:00"))
+        self.assertEqual(parsed.utcoffset().total_seconds(), 0)
+
+    def test_created_at_consistent_across_threads(self):
+        """Test concurrent timestamping never pairs a second with a stale prefix"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        with mock.patch.object(workflow_versioning, "_utcnow_cache", (-1, "")):
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                stamps = list(pool.map(lambda _: workflow_versioning._utcnow_iso(), range(2000)))
+
+        for stamp in stamps:
+            parsed = datetime.fromisoformat(stamp.replace("Z", "+00:00"))
+            self.assertEqual(parsed.utcoffset().total_seconds(), 0)
+
 
 class TestWorkflowVersionManager(unittest.TestCase):
     """Test WorkflowVersionManager class"""
@@ -132,6 +200,33 @@ class TestWorkflowVersionManager(unittest.TestCase):
         self.assertEqual(version.version, "1.0.0")
         self.assertEqual(version.workflow_name, "Test Workflow")
 
+    def test_create_version_interns_identifiers(self):
+        """Test versions of one workflow share interned id/name strings"""
+        v1 = self.manager.create_version(
+            self.workflow, version="1.0.0", workflow_id="".join(["wf", "-1"])
+        )
+        v2 = self.manager.create_version(
+            self.workflow, version="1.0.1", workflow_id="".join(["wf", "-1"])
+        )
+
+        self.assertIs(v1.workflow_id, v2.workflow_id)
+        self.assertIs(v1.workflow_name, v2.workflow_name)
+        self.assertIs(v1.created_by, v2.created_by)
+
+    def test_create_version_shared_timestamp(self):
+        """Test bulk callers can pass one shared creation timestamp"""
+        now = "2025-11-20T12:00:00.000000Z"
+
+        v1 = self.manager.create_version(self.workflow, version="1.0.0", now=now)
+        v2 = self.manager.version_bump(self.workflow, workflow_id=v1.workflow_id, now=now)
+        versioned = self.manager.add_version_to_workflow(self.workflow, "1.0.0", now=now)
+        bumped = bump_workflow_version(versioned, now=now)
+
+        self.assertEqual(v1.created_at, now)
+        self.assertEqual(v2.created_at, now)
+        self.assertEqual(versioned["updatedAt"], now)
+        self.assertEqual(bumped["updatedAt"], now)
+
     def test_version_bump_patch(self):
         """Test bumping patch version"""
         # Create initial version
@@ -216,6 +311,29 @@ class TestWorkflowVersionManager(unittest.TestCase):
 
         self.assertEqual(latest.version, "1.1.0")
 
+    def test_duplicate_versions(self):
+        """Test duplicate version strings keep insertion order"""
+        workflow_id = "test-workflow"
+
+        first = self.manager.create_version(
+            self.workflow, version="1.0.0", workflow_id=workflow_id
+        )
+        second = self.manager.create_version(
+            self.workflow, version="1.0.0", workflow_id=workflow_id
+        )
+
+        self.assertIs(self.manager.get_latest_version(workflow_id), second)
+        self.assertIs(self.manager.get_version(workflow_id, "1.0.0"), first)
+        self.assertEqual(
+            self.manager._sort_keys[workflow_id],
+            [v.parsed() for v in self.manager.versions[workflow_id]],
+        )
+
+    def test_create_version_invalid_raises(self):
+        """Test creating an unparseable version raises error"""
+        with self.assertRaises(ValueError):
+            self.manager.create_version(self.workflow, version="invalid")
+
     def test_get_version(self):
         """Test getting specific version"""
         workflow_id = "test-workflow"
@@ -304,6 +422,10 @@ class TestWorkflowVersionManager(unittest.TestCase):
         self.assertEqual(comparison["newer_version"], "2.0.0")
         self.assertEqual(comparison["older_version"], "1.0.0")
         self.assertIn("version_difference", comparison)
+        self.assertEqual(
+            comparison["version_difference"],
+            {"major": 1, "minor": 0, "patch": 0}
+        )
 
     def test_generate_diff(self):
         """Test generating workflow diff"""
@@ -327,6 +449,87 @@ class TestWorkflowVersionManager(unittest.TestCase):
         self.assertIsInstance(diff, str)
         self.assertIn("Node2", diff)
 
+    def test_generate_diff_structural(self):
+        """Test structural diff reports changed JSON paths"""
+        workflow1 = {"name": "Workflow", "nodes": [{"name": "Node1", "type": "a"}]}
+        workflow2 = {
+            "name": "Workflow",
+            "nodes": [{"name": "Node1", "type": "b"}, {"name": "Node2"}]
+        }
+
+        diff = self.manager.generate_diff(workflow1, workflow2, diff_algorithm="structural")
+
+        self.assertIn('~ nodes[0].type: "a" -> "b"', diff)
+        self.assertIn('+ nodes[1]: {"name": "Node2"}', diff)
+
+    def test_generate_diff_invalid_algorithm(self):
+        """Test invalid diff algorithm raises error"""
+        with self.assertRaises(ValueError):
+            self.manager.generate_diff({}, {}, diff_algorithm="invalid")
+
+    def test_generate_diff_stream(self):
+        """Test diff lines are yielded lazily and join to generate_diff"""
+        workflow1 = {"name": "Workflow", "nodes": [{"name": "Node1"}]}
+        workflow2 = {"name": "Workflow", "nodes": [{"name": "Node1"}, {"name": "Node2"}]}
+
+        lines = list(self.manager.generate_diff_stream(workflow1, workflow2))
+
+        self.assertEqual("".join(lines), self.manager.generate_diff(workflow1, workflow2))
+
+    def test_write_diff_to_file(self):
+        """Test streaming diff lines to a file-like object"""
+        workflow1 = {"name": "Workflow", "nodes": [{"name": "Node1"}]}
+        workflow2 = {"name": "Workflow", "nodes": [{"name": "Node1"}, {"name": "Node2"}]}
+        out = io.StringIO()
+
+        self.manager.write_diff(workflow1, workflow2, out)
+
+        self.assertEqual(out.getvalue(), self.manager.generate_diff(workflow1, workflow2))
+        self.assertIn("Node2", out.getvalue())
+
+    def test_write_diff_to_binary(self):
+        """Test streaming diff lines to a binary stream as UTF-8"""
+        workflow1 = {"name": "Workflow", "nodes": [{"name": "Node1"}]}
+        workflow2 = {"name": "Workflow", "nodes": [{"name": "N\u00f6de2"}]}
+        out = io.BytesIO()
+
+        self.manager.write_diff_bytes(workflow1, workflow2, out)
+
+        self.assertEqual(
+            out.getvalue().decode("utf-8"),
+            self.manager.generate_diff(workflow1, workflow2)
+        )
+
+    def test_generate_diff_identical(self):
+        """Test diff of identical workflows is empty"""
+        diff = self.manager.generate_diff(self.workflow, json.loads(json.dumps(self.workflow)))
+
+        self.assertEqual(diff, "")
+
+    def test_generate_diff_nan_to_null(self):
+        """Test a NaN value replaced by null is reported as a change"""
+        workflow1 = {"name": "W", "v": float("nan")}
+        workflow2 = {"name": "W", "v": None}
+
+        diff = self.manager.generate_diff(workflow1, workflow2)
+
+        self.assertIn("-  \"v\": NaN", diff)
+        self.assertIn("+  \"v\": null", diff)
+
+    def test_dumps_sorted_indent_matches_stdlib(self):
+        """Test diff serialization matches stdlib json formatting"""
+        data = {
+            "b": [1, 2, {"d": None, "c": True}],
+            "a": {"x": "N\u00f6de"},
+            "e": {},
+            "f": [1e16, 1e-7, 0.1, float("nan"), float("inf")],
+        }
+
+        self.assertEqual(
+            _dumps_sorted_indent(data),
+            json.dumps(data, indent=2, sort_keys=True)
+        )
+
     def test_detect_changes_nodes_added(self):
         """Test detecting added nodes"""
         workflow1 = {
@@ -397,6 +600,36 @@ class TestWorkflowVersionManager(unittest.TestCase):
 
         self.assertIn("Node1", changes["nodes_modified"])
 
+    def test_detect_changes_identical(self):
+        """Test identical workflows report no changes"""
+        changes = self.manager.detect_changes(self.workflow, dict(self.workflow))
+
+        self.assertFalse(changes["name_changed"])
+        self.assertEqual(changes["nodes_added"], [])
+        self.assertEqual(changes["nodes_modified"], [])
+        self.assertFalse(changes["breaking_changes"])
+
+    def test_detect_changes_ignores_volatile_fields(self):
+        """Test node IDs and target ordering are not reported as changes"""
+        target_a = {"node": "A", "type": "main", "index": 0}
+        target_b = {"node": "B", "type": "main", "index": 0}
+        workflow1 = {
+            "nodes": [{"name": "Node1", "type": "test", "id": "1"}],
+            "connections": {"Node1": {"main": [[target_a, target_b]]}},
+            "settings": {}
+        }
+        workflow2 = {
+            "nodes": [{"name": "Node1", "type": "test", "id": "2"}],
+            "connections": {"Node1": {"main": [[target_b, target_a]]}},
+            "settings": {}
+        }
+
+        changes = self.manager.detect_changes(workflow1, workflow2)
+
+        self.assertEqual(changes["nodes_modified"], [])
+        self.assertFalse(changes["connections_changed"])
+        self.assertFalse(changes["breaking_changes"])
+
     def test_suggest_version_bump_patch(self):
         """Test suggesting patch bump for minor changes"""
         workflow1 = {
@@ -471,6 +704,43 @@ class TestWorkflowVersionManager(unittest.TestCase):
 
         self.assertEqual(suggestion, "major")
 
+    def test_checksum_ignores_volatile_fields(self):
+        """Test checksum is stable across volatile metadata changes"""
+        workflow = dict(self.workflow, id="abc", updatedAt="2025-01-01T00:00:00Z")
+
+        checksum1 = self.manager._calculate_checksum(self.workflow)
+        checksum2 = self.manager._calculate_checksum(workflow)
+
+        self.assertTrue(checksum1.startswith("b2:"))
+        self.assertEqual(checksum1, checksum2)
+
+    def test_checksum_matches_full_serialization(self):
+        """Test streamed checksum hashes the same bytes as a full serialization"""
+        workflow = dict(self.workflow, id="abc", active=False, note="caf\u00e9")
+        content = {k: v for k, v in workflow.items() if k != "id"}
+        serialized = json.dumps(content, sort_keys=True)
+        expected = hashlib.blake2b(serialized.encode(), digest_size=16).hexdigest()
+
+        self.assertEqual(self.manager._calculate_checksum(workflow), f"b2:{expected}")
+
+    def test_checksum_lone_surrogate(self):
+        """Test parsed JSON containing an escaped lone surrogate can be checksummed"""
+        workflow = dict(self.workflow, **json.loads('{"note": "\\ud800"}'))
+
+        checksum = self.manager._calculate_checksum(workflow)
+
+        self.assertTrue(checksum.startswith("b2:"))
+        self.assertNotEqual(checksum, self.manager._calculate_checksum(self.workflow))
+
+    def test_suggest_version_bump_with_precomputed_changes(self):
+        """Test suggesting a bump from an existing detect_changes result"""
+        workflow2 = dict(self.workflow, nodes=[])
+        changes = self.manager.detect_changes(self.workflow, workflow2)
+
+        suggestion = self.manager.suggest_version_bump(self.workflow, workflow2, changes=changes)
+
+        self.assertEqual(suggestion, "major")
+
     def test_add_version_to_workflow(self):
         """Test adding version metadata to workflow"""
         workflow = {"name": "Test"}
@@ -487,6 +757,30 @@ class TestWorkflowVersionManager(unittest.TestCase):
         self.assertIn("meta", versioned)
         self.assertEqual(versioned["version"], "1.0.0")
 
+    def test_add_version_to_workflow_does_not_mutate_input(self):
+        """Test adding version metadata leaves the input workflow untouched"""
+        workflow = {"name": "Test", "meta": {"instanceId": "abc"}}
+
+        versioned = self.manager.add_version_to_workflow(workflow, version="1.0.0")
+
+        self.assertEqual(workflow, {"name": "Test", "meta": {"instanceId": "abc"}})
+        self.assertEqual(versioned["meta"]["instanceId"], "abc")
+        self.assertEqual(versioned["meta"]["version"], "1.0.0")
+
+    def test_add_version_to_workflow_inplace(self):
+        """Test inplace mode updates and returns the given workflow"""
+        workflow = {"name": "Test", "meta": {"instanceId": "abc"}}
+
+        versioned = self.manager.add_version_to_workflow(workflow, version="1.0.0", inplace=True)
+
+        self.assertIs(versioned, workflow)
+        self.assertEqual(workflow["version"], "1.0.0")
+        self.assertEqual(workflow["meta"], {
+            "instanceId": "abc",
+            "version": "1.0.0",
+            "versionId": workflow["versionId"]
+        })
+
     def test_export_version_history(self):
         """Test exporting version history"""
         workflow_id = "test-workflow"
@@ -509,6 +803,20 @@ class TestWorkflowVersionManager(unittest.TestCase):
         self.assertEqual(history["total_versions"], 2)
         self.assertIn("latest_version", history)
         self.assertEqual(history["latest_version"], "1.1.0")
+        self.assertEqual(history["first_version"], "1.0.0")
+        self.assertEqual([v["version"] for v in history["versions"]], ["1.1.0", "1.0.0"])
+
+    def test_iter_version_history(self):
+        """Test iterating version dicts lazily in both orders"""
+        workflow_id = "test-workflow"
+        self.manager.create_version(self.workflow, version="2.0.0", workflow_id=workflow_id)
+        self.manager.create_version(self.workflow, version="1.0.0", workflow_id=workflow_id)
+
+        history = self.manager.iter_version_history(workflow_id, ascending=True)
+
+        self.assertNotIsInstance(history, list)
+        self.assertEqual([v["version"] for v in history], ["1.0.0", "2.0.0"])
+        self.assertEqual(list(self.manager.iter_version_history("missing")), [])
 
 
 class TestConvenienceFunctions(unittest.TestCase):
@@ -551,6 +859,3 @@ class TestConvenienceFunctions(unittest.TestCase):
 
         self.assertEqual(bumped["version"], "1.1.0")
 
-
-if __name__ == '__main__':
-    unittest.main()